@@ -2,21 +2,24 @@
 from __future__ import annotations
 
 import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from hashlib import blake2b
 from typing import Optional, List, Dict, Any
-from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
 from jobspy.exception import BDJobsException
-from jobspy.bdjobs.constant import headers, search_params
+from jobspy.bdjobs.constant import headers, search_params, job_selectors
 from jobspy.bdjobs.util import (
     parse_location,
     parse_date,
     find_job_listings,
     is_job_remote,
+    parse_job_card,
 )
 from jobspy.model import (
     JobPost,
@@ -38,12 +41,27 @@ from jobspy.util import (
 
 log = create_logger("BDJobs")
 
+# Only build the job card subtrees of a search results page
+_JOB_CARD_STRAINER = SoupStrainer(
+    "div",
+    class_=re.compile(
+        r"(?:^|\s)(?:%s)(?:\s|$)"
+        % "|".join(selector.split(".", 1)[1] for selector in job_selectors)
+    ),
+)
+_JOB_ID_RE = re.compile(r"[?&]jobid=([^&]+)", re.IGNORECASE)
+_DETAIL_LABEL_RES = {
+    "job_type": re.compile(r"job type|employment type", re.IGNORECASE),
+    "company_industry": re.compile(r"industry", re.IGNORECASE),
+}
+
 
 class BDJobs(Scraper):
     base_url = "https://jobs.bdjobs.com"
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
     delay = 2
     band_delay = 3
+    jobs_per_page = 20
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
@@ -59,6 +77,8 @@ class BDJobs(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            # job page workers plus the background search page request
+            pool_maxsize=self.jobs_per_page + 1,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
@@ -71,8 +91,8 @@ class BDJobs(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
-        seen_ids = set()
+        # Insertion ordered, keyed by job id to drop duplicates
+        jobs_by_id: dict[str, JobPost] = {}
         page = 1
         request_count = 0
 
@@ -80,58 +100,103 @@ class BDJobs(Scraper):
         params = search_params.copy()
         params["txtsearch"] = scraper_input.search_term
 
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted
-
-        while continue_search():
-            request_count += 1
-            log.info(f"search page: {request_count}")
-
-            try:
-                # Add page parameter if needed
-                if page > 1:
-                    params["pg"] = page
+        continue_search = lambda: len(jobs_by_id) < scraper_input.results_wanted
 
-                response = self.session.get(
-                    self.search_url,
-                    params=params,
-                    timeout=getattr(scraper_input, "request_timeout", 60),
-                )
-
-                if response.status_code != 200:
-                    log.error(f"BDJobs response status code {response.status_code}")
-                    break
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                job_cards = find_job_listings(soup)
-
-                if not job_cards or len(job_cards) == 0:
-                    log.info("No more job listings found")
+        # Search pages are requested in the background, so the next page can
+        # download while the job pages of the current one are fetched
+        page_executor = ThreadPoolExecutor(max_workers=1)
+        next_response = page_executor.submit(self._fetch_search_page, params, page, 0)
+        try:
+            while continue_search():
+                request_count += 1
+                log.info(f"search page: {request_count}")
+
+                try:
+                    response = next_response.result()
+                    next_response = None
+
+                    if response.status_code != 200:
+                        log.error(f"BDJobs response status code {response.status_code}")
+                        break
+
+                    # BDJobs serves UTF-8, skip charset detection on the body
+                    response.encoding = "utf-8"
+                    soup = BeautifulSoup(
+                        response.text, "lxml", parse_only=_JOB_CARD_STRAINER
+                    )
+                    job_cards = find_job_listings(soup)
+                    if not job_cards:
+                        # Unknown card layout, look for job links on the full page
+                        soup = BeautifulSoup(response.text, "lxml")
+                        job_cards = find_job_listings(soup)
+
+                    if not job_cards or len(job_cards) == 0:
+                        log.info("No more job listings found")
+                        break
+
+                    log.info(f"Found {len(job_cards)} job cards on page {page}")
+
+                    # Prefetch the next page when this one cannot fill the results
+                    if len(jobs_by_id) + len(job_cards) < scraper_input.results_wanted:
+                        next_response = page_executor.submit(
+                            self._fetch_search_page, params, page + 1, self._delay()
+                        )
+
+                    page_jobs: list[JobPost] = []
+                    for job_card in job_cards:
+                        try:
+                            job_post = self._process_job(job_card)
+                            if job_post and job_post.id not in jobs_by_id:
+                                jobs_by_id[job_post.id] = job_post
+                                page_jobs.append(job_post)
+
+                                if not continue_search():
+                                    break
+                        except Exception as e:
+                            log.error(f"Error processing job card: {str(e)}")
+
+                    # Always fetch description for BDJobs
+                    self._add_job_details(page_jobs)
+
+                    page += 1
+                    if next_response is None and continue_search():
+                        next_response = page_executor.submit(
+                            self._fetch_search_page, params, page, self._delay()
+                        )
+
+                except Exception as e:
+                    log.error(f"Error during scraping: {str(e)}")
                     break
+        finally:
+            # Don't wait on a prefetched page that is no longer needed
+            page_executor.shutdown(wait=False, cancel_futures=True)
 
-                log.info(f"Found {len(job_cards)} job cards on page {page}")
-
-                for job_card in job_cards:
-                    try:
-                        job_post = self._process_job(job_card)
-                        if job_post and job_post.id not in seen_ids:
-                            seen_ids.add(job_post.id)
-                            job_list.append(job_post)
-
-                            if not continue_search():
-                                break
-                    except Exception as e:
-                        log.error(f"Error processing job card: {str(e)}")
-
-                page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+        job_list = list(jobs_by_id.values())[: scraper_input.results_wanted]
+        return JobResponse(jobs=job_list)
 
-            except Exception as e:
-                log.error(f"Error during scraping: {str(e)}")
-                break
+    def _delay(self) -> float:
+        """
+        Random delay between two search page requests
+        """
+        return random.uniform(self.delay, self.delay + self.band_delay)
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+    def _fetch_search_page(self, params: dict, page: int, delay: float):
+        """
+        Waits for the delay, then requests a search results page
+        :param params: Search parameters
+        :param page: Page number
+        :param delay: Seconds to wait before the request
+        :return: response
+        """
+        time.sleep(delay)
+        # Add page parameter if needed
+        if page > 1:
+            params = {**params, "pg": page}
+        return self.session.get(
+            self.search_url,
+            params=params,
+            timeout=getattr(self.scraper_input, "request_timeout", 60),
+        )
 
     def _process_job(self, job_card: Tag) -> Optional[JobPost]:
         """
@@ -140,88 +205,37 @@ class BDJobs(Scraper):
         :return: JobPost object
         """
         try:
-            # Extract job ID and URL
-            job_link = job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
-            if not job_link:
+            # Extract the job link and fields in a single walk of the card
+            card = parse_job_card(job_card)
+            if not card:
                 return None
 
-            job_url = job_link.get("href")
-            if not job_url.startswith("http"):
-                job_url = urljoin(self.base_url, job_url)
+            job_url = card["href"]
+            if job_url.startswith("//"):
+                # Protocol-relative link to another host
+                job_url = f"https:{job_url}"
+            elif not job_url.startswith("http"):
+                # BDJobs links are relative to the site root
+                sep = "" if job_url.startswith("/") else "/"
+                job_url = f"{self.base_url}{sep}{job_url}"
 
             # Extract job ID from URL
+            job_id_match = _JOB_ID_RE.search(job_url)
             job_id = (
-                job_url.split("jobid=")[-1].split("&")[0]
-                if "jobid=" in job_url
-                else f"bdjobs-{hash(job_url)}"
-            )
-
-            # Extract title
-            title = job_link.get_text(strip=True)
-            if not title:
-                title_elem = job_card.find(
-                    ["h2", "h3", "h4", "strong", "div"],
-                    class_=lambda c: c and "job-title-text" in c,
-                )
-                title = title_elem.get_text(strip=True) if title_elem else "N/A"
-
-            # Extract company name - IMPROVED
-            company_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "comp-name-text" in (c or "").lower(),
+                job_id_match.group(1)
+                if job_id_match
+                else f"bdjobs-{blake2b(job_url.encode(), digest_size=8).hexdigest()}"
             )
-            if company_elem:
-                company_name = company_elem.get_text(strip=True)
-            else:
-                # Try alternative selectors
-                company_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["company", "org", "comp-name"]
-                    ),
-                )
-                company_name = (
-                    company_elem.get_text(strip=True) if company_elem else "N/A"
-                )
 
-            # Extract location
-            location_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "locon-text-d" in (c or "").lower(),
-            )
-            if not location_elem:
-                location_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["location", "area", "locon"]
-                    ),
-                )
-            location_text = (
-                location_elem.get_text(strip=True)
-                if location_elem
-                else "Dhaka, Bangladesh"
-            )
+            title = card["title"] or "N/A"
+            company_name = card["company"] or "N/A"
+            location_text = card["location"] or "Dhaka, Bangladesh"
 
             # Create Location object
             location = parse_location(location_text, self.country)
 
             # Extract date posted
-            date_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c
-                and any(
-                    term in (c or "").lower()
-                    for term in ["date", "deadline", "published"]
-                ),
-            )
-            date_posted = None
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                date_posted = parse_date(date_text)
+            date_posted = parse_date(card["date"]) if card["date"] else None
 
             # Check if job is remote
             is_remote = is_job_remote(title, location=location)
@@ -238,16 +252,28 @@ class BDJobs(Scraper):
                 site=self.site,
             )
 
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
-            job_post.description = job_details.get("description", "")
-            job_post.job_type = job_details.get("job_type", "")
-
             return job_post
         except Exception as e:
             log.error(f"Error in _process_job: {str(e)}")
             return None
 
+    def _add_job_details(self, job_posts: list[JobPost]) -> None:
+        """
+        Fetches the job pages of the given job posts concurrently
+        :param job_posts: JobPost objects to fill in
+        """
+        if not job_posts:
+            return
+        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
+            job_details = list(
+                executor.map(
+                    self._get_job_details, [job_post.job_url for job_post in job_posts]
+                )
+            )
+        for job_post, details in zip(job_posts, job_details):
+            job_post.description = details.get("description", "")
+            job_post.job_type = details.get("job_type", "")
+
     def _get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
         Gets detailed job information from the job page
@@ -259,25 +285,29 @@ class BDJobs(Scraper):
             if response.status_code != 200:
                 return {}
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            response.encoding = "utf-8"
+            soup = BeautifulSoup(response.text, "lxml")
 
             # Find job description - IMPROVED based on correct.py
             description = ""
 
             # Try to find the job content div first (as in correct.py)
-            job_content_div = soup.find("div", class_="jobcontent")
+            job_content_div = soup.select_one("div.jobcontent")
             if job_content_div:
                 # Look for responsibilities section
-                responsibilities_heading = job_content_div.find(
-                    "h4", id="job_resp"
+                responsibilities_heading = job_content_div.select_one(
+                    "h4#job_resp"
                 ) or job_content_div.find(
                     ["h4", "h5"], string=lambda s: s and "responsibilities" in s.lower()
                 )
+                responsibilities_elements = []
                 if responsibilities_heading:
-                    responsibilities_elements = []
-                    # Find all following elements until the next heading or hr
-                    for sibling in responsibilities_heading.find_next_siblings():
-                        if sibling.name in ["hr", "h4", "h5"]:
+                    # Find all following elements until the next heading or hr,
+                    # next_siblings is lazy so nothing past the stop tag is visited
+                    for sibling in responsibilities_heading.next_siblings:
+                        if not isinstance(sibling, Tag):
+                            continue
+                        if sibling.name in ("hr", "h4", "h5"):
                             break
                         if sibling.name == "ul":
                             responsibilities_elements.extend(
@@ -307,45 +337,40 @@ class BDJobs(Scraper):
                 )
                 if description_elem:
                     description_elem = remove_attributes(description_elem)
-                    description = description_elem.prettify(formatter="html")
                     if (
                         hasattr(self.scraper_input, "description_format")
                         and self.scraper_input.description_format
                         == DescriptionFormat.MARKDOWN
                     ):
-                        description = markdown_converter(description)
-
-            # Extract job type
-            job_type_elem = soup.find(
-                ["span", "div"],
-                string=lambda s: s
-                and any(
-                    term in (s or "").lower()
-                    for term in ["job type", "employment type"]
-                ),
-            )
-            job_type = None
-            if job_type_elem:
-                job_type_text = job_type_elem.find_next(["span", "div"]).get_text(
-                    strip=True
-                )
-                job_type = job_type_text if job_type_text else None
-
-            # Extract company industry
-            industry_elem = soup.find(
-                ["span", "div"], string=lambda s: s and "industry" in (s or "").lower()
-            )
-            company_industry = None
-            if industry_elem:
-                industry_text = industry_elem.find_next(["span", "div"]).get_text(
-                    strip=True
-                )
-                company_industry = industry_text if industry_text else None
+                        # Convert the parsed element, no serialize and re-parse
+                        description = markdown_converter(description_elem)
+                    else:
+                        # decode() skips prettify's re-indenting pass, so the
+                        # html is no longer indented
+                        description = description_elem.decode(formatter="html")
+
+            # Extract job type and company industry in a single pass, the value
+            # is the span/div that follows the label
+            labelled = {}
+            elements = soup.find_all(["span", "div"])
+            for i, elem in enumerate(elements):
+                label = elem.string
+                if not label:
+                    continue
+                for key, label_re in _DETAIL_LABEL_RES.items():
+                    if key not in labelled and label_re.search(label):
+                        value_elem = elements[i + 1] if i + 1 < len(elements) else None
+                        value_text = (
+                            value_elem.get_text(strip=True) if value_elem else None
+                        )
+                        labelled[key] = value_text if value_text else None
+                if len(labelled) == len(_DETAIL_LABEL_RES):
+                    break
 
             return {
                 "description": description,
-                "job_type": job_type,
-                "company_industry": company_industry,
+                "job_type": labelled.get("job_type"),
+                "company_industry": labelled.get("company_industry"),
             }
 
         except Exception as e:
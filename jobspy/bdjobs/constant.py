@@ -21,12 +21,3 @@ job_selectors = [
     "div.norm-jobs-wrapper",  # Catches normal job listings
     "div.featured-wrap",  # Catches featured job listings
 ]
-
-# Date formats used by BDJobs
-date_formats = [
-    "%d %b %Y",
-    "%d-%b-%Y",
-    "%d %B %Y",
-    "%B %d, %Y",
-    "%d/%m/%Y",
-]
@@ -1,9 +1,40 @@
 # util.py
+import re
+from functools import lru_cache
+
 from bs4 import BeautifulSoup
+from bs4.element import Tag
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from jobspy.model import Location, Country
+from .constant import job_selectors
+
+# Links to job detail pages
+_JOB_LINK_RE = re.compile(r"jobdetail", re.IGNORECASE)
+
+# Job card fields by tag name, as (field, class pattern) pairs matched against
+# the lowercased class string. The first element found for a field wins.
+_TITLE_FIELD = ("title", re.compile(r"job-title-text"))
+_INFO_FIELDS = [
+    ("company", re.compile(r"comp-name-text")),
+    ("company_fallback", re.compile(r"company|org|comp-name")),
+    ("location", re.compile(r"locon-text-d")),
+    ("location_fallback", re.compile(r"location|area|locon")),
+    ("date", re.compile(r"date|deadline|published")),
+]
+_JOB_CARD_FIELDS = {
+    "h2": [_TITLE_FIELD],
+    "h3": [_TITLE_FIELD],
+    "h4": [_TITLE_FIELD],
+    "strong": [_TITLE_FIELD],
+    "span": _INFO_FIELDS,
+    "div": [_TITLE_FIELD, *_INFO_FIELDS],
+}
+_JOB_CARD_TAGS = ["a", *_JOB_CARD_FIELDS]
+
+# Keywords that mark a job as remote
+_REMOTE_RE = re.compile(r"remote|work from home|wfh|home based", re.IGNORECASE)
 
 
 def parse_location(location_text: str, country: str = "bangladesh") -> Location:
@@ -24,49 +55,92 @@ def parse_location(location_text: str, country: str = "bangladesh") -> Location:
         )
 
 
+@lru_cache(maxsize=512)
 def parse_date(date_text: str) -> Optional[datetime]:
     """
     Parses date text into a datetime object
     :param date_text: Date text from job listing
     :return: datetime object or None if parsing fails
     """
-    from .constant import date_formats
-
     try:
         # Clean up date text
         if "Deadline:" in date_text:
             date_text = date_text.replace("Deadline:", "").strip()
 
-        # Try different date formats
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_text, fmt)
-            except ValueError:
-                continue
-
-        return None
+        # Pick the one format that fits the shape of the text
+        if "/" in date_text:
+            fmt = "%d/%m/%Y"
+        elif "-" in date_text:
+            fmt = "%d-%b-%Y"
+        elif "," in date_text:
+            fmt = "%B %d, %Y"
+        elif len(date_text.split()[1]) <= 3:
+            fmt = "%d %b %Y"
+        else:
+            fmt = "%d %B %Y"
+
+        return datetime.strptime(date_text, fmt)
     except Exception:
         return None
 
 
+def parse_job_card(job_card: Tag) -> Dict[str, Any]:
+    """
+    Extracts the job link and fields of a job card in a single walk
+    :param job_card: Job card element
+    :return: Dictionary with href, title, company, location and date texts,
+        empty if the card has no job detail link
+    """
+    job_link = None
+    elems = {}
+    for elem in job_card.find_all(_JOB_CARD_TAGS):
+        if elem.name == "a":
+            href = elem.get("href")
+            if job_link is None and href and _JOB_LINK_RE.search(href):
+                job_link = elem
+            continue
+        classes = elem.get("class")
+        if not classes:
+            continue
+        class_text = " ".join(classes).lower()
+        for field, class_re in _JOB_CARD_FIELDS[elem.name]:
+            if field not in elems and class_re.search(class_text):
+                elems[field] = elem
+
+    if job_link is None:
+        return {}
+
+    def field_text(*fields: str) -> Optional[str]:
+        for field in fields:
+            if field in elems:
+                return elems[field].get_text(strip=True)
+        return None
+
+    return {
+        "href": job_link.get("href"),
+        "title": job_link.get_text(strip=True) or field_text("title"),
+        "company": field_text("company", "company_fallback"),
+        "location": field_text("location", "location_fallback"),
+        "date": field_text("date"),
+    }
+
+
 def find_job_listings(soup: BeautifulSoup) -> List[Any]:
     """
     Finds job listing elements in the HTML
     :param soup: BeautifulSoup object
     :return: List of job card elements
     """
-    from .constant import job_selectors
-
-    # Try different selectors
+    # Match all selectors in one pass, then return the first selector's matches
+    elements = soup.select(", ".join(job_selectors))
     for selector in job_selectors:
-        if "." in selector:
-            tag_name, class_name = selector.split(".", 1)
-            elements = soup.find_all(tag_name, class_=class_name)
-            if elements and len(elements) > 0:
-                return elements
+        class_name = selector.split(".", 1)[1]
+        matches = [el for el in elements if class_name in el.get("class", [])]
+        if matches:
+            return matches
 
     # If no selectors match, look for job detail links
-    job_links = soup.find_all("a", href=lambda h: h and "jobdetail" in h.lower())
+    job_links = soup.find_all("a", href=_JOB_LINK_RE)
     if job_links:
         # Return parent elements of job links
         return [link.parent for link in job_links]
@@ -84,14 +158,12 @@ def is_job_remote(
     :param location: Job location
     :return: True if job is remote, False otherwise
     """
-    remote_keywords = ["remote", "work from home", "wfh", "home based"]
-
     # Combine all text fields
-    full_text = title.lower()
+    full_text = title
     if description:
-        full_text += " " + description.lower()
+        full_text += " " + description
     if location:
-        full_text += " " + location.display_location().lower()
+        full_text += " " + location.display_location()
 
     # Check for remote keywords
-    return any(keyword in full_text for keyword in remote_keywords)
+    return bool(_REMOTE_RE.search(full_text))
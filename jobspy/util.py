@@ -8,7 +8,8 @@ import numpy as np
 import requests
 import tls_client
 import urllib3
-from markdownify import markdownify as md
+from bs4.element import Tag
+from markdownify import MarkdownConverter, markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
 from jobspy.model import CompensationInterval, JobType, Site
@@ -53,23 +54,35 @@ class RotatingProxySession:
 
 
 class RequestsRotating(RotatingProxySession, requests.Session):
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        pool_maxsize=None,
+    ):
         RotatingProxySession.__init__(self, proxies=proxies)
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
-        self.setup_session(has_retry, delay)
+        self.setup_session(has_retry, delay, pool_maxsize)
 
-    def setup_session(self, has_retry, delay):
+    def setup_session(self, has_retry, delay, pool_maxsize=None):
+        adapter_kwargs = {}
         if has_retry:
-            retries = Retry(
+            adapter_kwargs["max_retries"] = Retry(
                 total=3,
                 connect=3,
                 status=3,
                 status_forcelist=[500, 502, 503, 504, 429],
                 backoff_factor=delay,
             )
-            adapter = HTTPAdapter(max_retries=retries)
+        if pool_maxsize:
+            # keep-alive connections kept per host, size to the number of workers
+            adapter_kwargs["pool_maxsize"] = pool_maxsize
+        if adapter_kwargs:
+            adapter = HTTPAdapter(**adapter_kwargs)
             self.mount("http://", adapter)
             self.mount("https://", adapter)
 
@@ -111,9 +124,10 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    pool_maxsize: int | None = None,
 ) -> requests.Session:
     """
-    Creates a requests session with optional tls, proxy, and retry settings.
+    Creates a requests session with optional tls, proxy, retry and connection pool settings.
     :return: A session object
     """
     if is_tls:
@@ -124,6 +138,7 @@ def create_session(
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            pool_maxsize=pool_maxsize,
         )
 
     if ca_cert:
@@ -151,10 +166,14 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
-def markdown_converter(description_html: str):
+def markdown_converter(description_html: str | Tag):
     if description_html is None:
         return None
-    markdown = md(description_html)
+    if isinstance(description_html, Tag):
+        # already parsed, skip markdownify's own html.parser pass
+        markdown = MarkdownConverter().convert_soup(description_html)
+    else:
+        markdown = md(description_html)
     return markdown.strip()
 
 